@@ -1,14 +1,17 @@
-import { app, BrowserWindow, ipcMain, session, dialog } from 'electron';
-import { exec, spawn } from 'child_process';
+import { app, BrowserWindow, ipcMain, dialog } from 'electron';
+import { execFile, spawn } from 'child_process';
 import { fileURLToPath } from 'url';
 import { dirname } from 'path';
 import { readdir } from 'fs/promises';
-import { join } from 'path';
+import { join, extname } from 'path';
 import settingsManager from './src/js/settings-manager.js';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = dirname(__filename);
 
+// File types picked up when scanning the music folder
+const AUDIO_EXTENSIONS = new Set(['.mp3', '.wav', '.flac', '.m4a', '.aac', '.ogg', '.wma']);
+
 let mainWindow;
 let rtlProcess = null;
 let audioProcess = null;
@@ -21,6 +24,10 @@ app.whenReady().then(() => {
     height: windowSettings.height,
     fullscreen: windowSettings.fullscreen,
     titleBarStyle: 'hvisibleidden',
+    // Stay hidden until the first frame is painted, and match the page
+    // background so the window never flashes white while loading
+    show: false,
+    backgroundColor: '#000000',
     webPreferences: {
       nodeIntegration: true,
       contextIsolation: false,
@@ -91,40 +98,44 @@ mainWindow.webContents.session.on('select-usb-device', (event, details, callback
     console.log('USB device removed:', device);
   });
 
+  mainWindow.once('ready-to-show', () => {
+    mainWindow.show();
+  });
+
   mainWindow.loadFile('index.html');
 
 });
 
 // Output volume (speakers/headphones)
 ipcMain.on('set-output-volume', (event, volume) => {
-  exec(`pactl set-sink-volume @DEFAULT_SINK@ ${volume}%`, (err) => {
+  execFile('pactl', ['set-sink-volume', '@DEFAULT_SINK@', `${volume}%`], (err) => {
     if (err) console.error('Output volume error:', err);
   });
 });
 
 // Input volume (microphone)
 ipcMain.on('set-input-volume', (event, volume) => {
-  exec(`pactl set-source-volume @DEFAULT_SOURCE@ ${volume}%`, (err) => {
+  execFile('pactl', ['set-source-volume', '@DEFAULT_SOURCE@', `${volume}%`], (err) => {
     if (err) console.error('Input volume error:', err);
   });
 });
 
 // Mute controls
 ipcMain.on('toggle-output-mute', (event) => {
-  exec(`pactl set-sink-mute @DEFAULT_SINK@ toggle`, (err) => {
+  execFile('pactl', ['set-sink-mute', '@DEFAULT_SINK@', 'toggle'], (err) => {
     if (err) console.error('Output mute error:', err);
   });
 });
 
 ipcMain.on('toggle-input-mute', (event) => {
-  exec(`pactl set-source-mute @DEFAULT_SOURCE@ toggle`, (err) => {
+  execFile('pactl', ['set-source-mute', '@DEFAULT_SOURCE@', 'toggle'], (err) => {
     if (err) console.error('Input mute error:', err);
   });
 });
 
 // Brightness control
 ipcMain.on('set-brightness', (event, brightness) => {
-  exec(`brightnessctl set ${brightness}%`, (err) => {
+  execFile('brightnessctl', ['set', `${brightness}%`], (err) => {
     if (err) console.error('Brightness error:', err);
   });
 });
@@ -226,7 +237,7 @@ ipcMain.on('stop-radio', () => {
 });
 
 ipcMain.on('test-rtlsdr', (event) => {
-  exec('rtl_test -t', { timeout: 3000 }, (err, stdout, stderr) => {
+  execFile('rtl_test', ['-t'], { timeout: 3000 }, (err, stdout, stderr) => {
     if (err) {
       event.reply('rtlsdr-status', { connected: false, error: err.message });
     } else {
@@ -288,7 +299,6 @@ ipcMain.handle('select-music-folder', async () => {
 ipcMain.handle('get-music-files', async (event, folderPath) => {
   try {
     const files = [];
-    const audioExtensions = ['.mp3', '.wav', '.flac', '.m4a', '.aac', '.ogg', '.wma'];
 
     async function scanDirectory(dirPath) {
       const entries = await readdir(dirPath, { withFileTypes: true });
@@ -299,8 +309,7 @@ ipcMain.handle('get-music-files', async (event, folderPath) => {
         if (entry.isDirectory()) {
           await scanDirectory(fullPath);
         } else if (entry.isFile()) {
-          const ext = entry.name.substring(entry.name.lastIndexOf('.')).toLowerCase();
-          if (audioExtensions.includes(ext)) {
+          if (AUDIO_EXTENSIONS.has(extname(entry.name).toLowerCase())) {
             files.push(fullPath);
           }
         }
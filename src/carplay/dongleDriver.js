@@ -19,6 +19,11 @@ import {
 const CONFIG_NUMBER = 1
 const MAX_ERROR_COUNT = 5
 
+// Wrap a transfer's DataView as a Buffer over the same memory, honouring
+// its offset and length instead of the whole backing ArrayBuffer
+const viewToBuffer = view =>
+  Buffer.from(view.buffer, view.byteOffset, view.byteLength)
+
 export const HandDriveType = {
   LHD: 0,
   RHD: 1,
@@ -53,8 +58,10 @@ export const DEFAULT_CONFIG = {
 export class DriverStateError extends Error {}
 
 export class DongleDriver extends EventEmitter {
-  constructor() {
+  constructor({ debug = false } = {}) {
     super()
+    // Per-packet read logging; far too chatty for normal streaming
+    this.debug = debug
     this._heartbeatInterval = null
     this._device = null
     this._inEP = null
@@ -70,6 +77,16 @@ export class DongleDriver extends EventEmitter {
     { vendorId: 0x05ac, productId: 0x12a8 },
   ]
 
+  // First device in the list that is one of the dongles above
+  static findKnownDevice(devices) {
+    return devices.find((d) =>
+      DongleDriver.knownDevices.some(
+        (known) =>
+          known.vendorId === d.vendorId && known.productId === d.productId,
+      ),
+    )
+  }
+
   initialise = async (device) => {
     if (this._device) {
       return
@@ -162,17 +179,17 @@ export class DongleDriver extends EventEmitter {
       }
 
       try {
-        console.log('Waiting for header data...')
+        if (this.debug) console.log('Waiting for header data...')
         const headerData = await this._device?.transferIn(
           this._inEP.endpointNumber,
           MessageHeader.dataLength,
         )
-        console.log('Received header data:', headerData)
-        const data = headerData?.data?.buffer
+        if (this.debug) console.log('Received header data:', headerData)
+        const data = headerData?.data
         if (!data) {
           throw new HeaderBuildError('Failed to read header data')
         }
-        const header = MessageHeader.fromBuffer(Buffer.from(data))
+        const header = MessageHeader.fromBuffer(viewToBuffer(data))
         let extraData = undefined
         if (header.length) {
           const extraDataRes = (
@@ -180,16 +197,16 @@ export class DongleDriver extends EventEmitter {
               this._inEP.endpointNumber,
               header.length,
             )
-          )?.data?.buffer
+          )?.data
           if (!extraDataRes) {
             console.error('Failed to read extra data')
             return
           }
-          extraData = Buffer.from(extraDataRes)
+          extraData = viewToBuffer(extraDataRes)
         }
 
         const message = header.toMessage(extraData)
-        console.log('Parsed message:', message?.constructor?.name)
+        if (this.debug) console.log('Parsed message:', message?.constructor?.name)
         if (message) this.emit('message', message)
       } catch (error) {
         if (error instanceof HeaderBuildError) {
@@ -22,6 +22,7 @@ import {
   Unplugged,
   Phase,
 } from './readable.js'
+import { safeAscii } from './utils.js'
 
 export const CommandMapping = {
   invalid: 0,
@@ -70,6 +71,11 @@ export const CommandMapping = {
   wifiPair: 1012,
 }
 
+// Reverse index of CommandMapping, built once, for naming received commands
+export const CommandNames = Object.fromEntries(
+  Object.entries(CommandMapping).map(([name, value]) => [value, name]),
+)
+
 export const MessageType = {
   Open: 0x01,
   Plugged: 0x02,
@@ -99,6 +105,12 @@ export const MessageType = {
 
 export class HeaderBuildError extends Error {}
 
+// Payload bytes shown when logging a message type we cannot parse
+const UNKNOWN_DUMP_BYTES = 64
+
+// The type check word is the bitwise inverse of the type as an unsigned u32
+const typeCheckFor = type => ~type >>> 0
+
 export class MessageHeader {
   constructor(length, type) {
     this.length = length
@@ -118,66 +130,38 @@ export class MessageHeader {
     const length = data.readUInt32LE(4)
     const msgType = data.readUInt32LE(8)
     const typeCheck = data.readUInt32LE(12)
-    if (typeCheck != ((msgType ^ -1) & 0xffffffff) >>> 0) {
+    if (typeCheck !== typeCheckFor(msgType)) {
       throw new HeaderBuildError(`Invalid type check, received ${typeCheck}`)
     }
     return new MessageHeader(length, msgType)
   }
 
   static asBuffer(messageType, byeLength) {
-    const dataLen = Buffer.alloc(4)
-    dataLen.writeUInt32LE(byeLength)
-    const type = Buffer.alloc(4)
-    type.writeUInt32LE(messageType)
-    const typeCheck = Buffer.alloc(4)
-    typeCheck.writeUInt32LE(((messageType ^ -1) & 0xffffffff) >>> 0)
-    const magicNumber = Buffer.alloc(4)
-    magicNumber.writeUInt32LE(MessageHeader.magic)
-    return Buffer.concat([magicNumber, dataLen, type, typeCheck])
+    const header = Buffer.alloc(MessageHeader.dataLength)
+    MessageHeader.writeTo(header, messageType, byeLength)
+    return header
+  }
+
+  // Write a header at the start of a buffer that also holds the payload
+  static writeTo(target, messageType, byteLength) {
+    target.writeUInt32LE(MessageHeader.magic, 0)
+    target.writeUInt32LE(byteLength, 4)
+    target.writeUInt32LE(messageType, 8)
+    target.writeUInt32LE(typeCheckFor(messageType), 12)
   }
 
   toMessage(data) {
     const { type } = this
     if (data) {
-      switch (type) {
-        case MessageType.AudioData:
-          return new AudioData(this, data)
-        case MessageType.VideoData:
-          return new VideoData(this, data)
-        case MessageType.MediaData:
-          return new MediaData(this, data)
-        case MessageType.BluetoothAddress:
-          return new BluetoothAddress(this, data)
-        case MessageType.BluetoothDeviceName:
-          return new BluetoothDeviceName(this, data)
-        case MessageType.BluetoothPIN:
-          return new BluetoothPIN(this, data)
-        case MessageType.ManufacturerInfo:
-          return new ManufacturerInfo(this, data)
-        case MessageType.SoftwareVersion:
-          return new SoftwareVersion(this, data)
-        case MessageType.Command:
-          return new Command(this, data)
-        case MessageType.Plugged:
-          return new Plugged(this, data)
-        case MessageType.WifiDeviceName:
-          return new WifiDeviceName(this, data)
-        case MessageType.HiCarLink:
-          return new HiCarLink(this, data)
-        case MessageType.BluetoothPairedList:
-          return new BluetoothPairedList(this, data)
-        case MessageType.Open:
-          return new Opened(this, data)
-        case MessageType.BoxSettings:
-          return new BoxInfo(this, data)
-        case MessageType.Phase:
-          return new Phase(this, data)
-        default:
-          console.debug(
-            `Unknown message type: ${type}, data: ${data.toString()}`,
-          )
-          return null
+      const MessageClass = getMessageClasses().get(type)
+      if (MessageClass) {
+        return new MessageClass(this, data)
       }
+      // Only dump the start of the payload; unknown types can be large
+      const shown = safeAscii(data.subarray(0, UNKNOWN_DUMP_BYTES))
+      const more = data.length > UNKNOWN_DUMP_BYTES ? '...' : ''
+      console.debug(`Unknown message type: ${type}, data: ${shown}${more}`)
+      return null
     } else {
       switch (type) {
         case MessageType.Unplugged:
@@ -191,4 +175,33 @@ export class MessageHeader {
 
   static dataLength = 16
   static magic = 0x55aa55aa
+}
+
+// Parsers for messages that carry a payload, keyed by header type. Built on
+// first use: readable.js imports this module, so its classes are not yet
+// initialised while this module body runs
+let messageClasses = null
+
+const getMessageClasses = () => {
+  if (!messageClasses) {
+    messageClasses = new Map([
+      [MessageType.AudioData, AudioData],
+      [MessageType.VideoData, VideoData],
+      [MessageType.MediaData, MediaData],
+      [MessageType.BluetoothAddress, BluetoothAddress],
+      [MessageType.BluetoothDeviceName, BluetoothDeviceName],
+      [MessageType.BluetoothPIN, BluetoothPIN],
+      [MessageType.ManufacturerInfo, ManufacturerInfo],
+      [MessageType.SoftwareVersion, SoftwareVersion],
+      [MessageType.Command, Command],
+      [MessageType.Plugged, Plugged],
+      [MessageType.WifiDeviceName, WifiDeviceName],
+      [MessageType.HiCarLink, HiCarLink],
+      [MessageType.BluetoothPairedList, BluetoothPairedList],
+      [MessageType.Open, Opened],
+      [MessageType.BoxSettings, BoxInfo],
+      [MessageType.Phase, Phase],
+    ])
+  }
+  return messageClasses
 }
\ No newline at end of file
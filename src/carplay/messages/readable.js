@@ -25,6 +25,23 @@ export class Message {
   }
 }
 
+// Messages whose payload is an ASCII string. The raw bytes are kept and
+// only decoded the first time the text is read
+class AsciiMessage extends Message {
+  constructor(header, data) {
+    super(header)
+    this.raw = data
+    this._text = undefined
+  }
+
+  get text() {
+    if (this._text === undefined) {
+      this._text = this.raw.toString('ascii')
+    }
+    return this._text
+  }
+}
+
 export class Command extends Message {
   constructor(header, data) {
     super(header)
@@ -40,52 +57,45 @@ export class ManufacturerInfo extends Message {
   }
 }
 
-export class SoftwareVersion extends Message {
-  constructor(header, data) {
-    super(header)
-    this.version = data.toString('ascii')
+export class SoftwareVersion extends AsciiMessage {
+  get version() {
+    return this.text
   }
 }
 
-export class BluetoothAddress extends Message {
-  constructor(header, data) {
-    super(header)
-    this.address = data.toString('ascii')
+export class BluetoothAddress extends AsciiMessage {
+  get address() {
+    return this.text
   }
 }
 
-export class BluetoothPIN extends Message {
-  constructor(header, data) {
-    super(header)
-    this.pin = data.toString('ascii')
+export class BluetoothPIN extends AsciiMessage {
+  get pin() {
+    return this.text
   }
 }
 
-export class BluetoothDeviceName extends Message {
-  constructor(header, data) {
-    super(header)
-    this.name = data.toString('ascii')
+export class BluetoothDeviceName extends AsciiMessage {
+  get name() {
+    return this.text
   }
 }
 
-export class WifiDeviceName extends Message {
-  constructor(header, data) {
-    super(header)
-    this.name = data.toString('ascii')
+export class WifiDeviceName extends AsciiMessage {
+  get name() {
+    return this.text
   }
 }
 
-export class HiCarLink extends Message {
-  constructor(header, data) {
-    super(header)
-    this.link = data.toString('ascii')
+export class HiCarLink extends AsciiMessage {
+  get link() {
+    return this.text
   }
 }
 
-export class BluetoothPairedList extends Message {
-  constructor(header, data) {
-    super(header)
-    this.data = data.toString('ascii')
+export class BluetoothPairedList extends AsciiMessage {
+  get data() {
+    return this.text
   }
 }
 
@@ -97,22 +107,26 @@ export const PhoneType = {
   HiCar: 6,
 }
 
+// Reverse index of PhoneType for naming the type reported by Plugged
+export const PhoneTypeNames = Object.fromEntries(
+  Object.entries(PhoneType).map(([name, value]) => [value, name]),
+)
+
 export class Plugged extends Message {
   constructor(header, data) {
     super(header)
     const wifiAvail = Buffer.byteLength(data) === 8
+    this.phoneType = data.readUInt32LE(0)
+    this.wifi = wifiAvail ? data.readUInt32LE(4) : undefined
     if (wifiAvail) {
-      this.phoneType = data.readUInt32LE(0)
-      this.wifi = data.readUInt32LE(4)
       console.debug(
         'wifi avail, phone type: ',
-        Object.keys(PhoneType).find(k => PhoneType[k] === this.phoneType),
+        PhoneTypeNames[this.phoneType],
         ' wifi: ',
         this.wifi,
       )
     } else {
-      this.phoneType = data.readUInt32LE(0)
-      console.debug('no wifi avail, phone type: ', Object.keys(PhoneType).find(k => PhoneType[k] === this.phoneType))
+      console.debug('no wifi avail, phone type: ', PhoneTypeNames[this.phoneType])
     }
   }
 }
@@ -181,13 +195,24 @@ export class AudioData extends Message {
     this.decodeType = data.readUInt32LE(0)
     this.volume = data.readFloatLE(4)
     this.audioType = data.readUInt32LE(8)
+    // Assign every field up front so all packets share one object shape
+    this.command = undefined
+    this.volumeDuration = undefined
+    this.data = undefined
     const amount = data.length - 12
     if (amount === 1) {
       this.command = data.readInt8(12)
     } else if (amount === 4) {
       this.volumeDuration = data.readFloatLE(12)
     } else {
-      this.data = new Int16Array(data.buffer, 12)
+      // View the PCM samples in place; Int16Array needs an even byte
+      // offset, so only copy when the transfer left them misaligned
+      const offset = data.byteOffset + 12
+      const samples = amount >> 1
+      this.data =
+        offset % 2 === 0
+          ? new Int16Array(data.buffer, offset, samples)
+          : new Int16Array(data.buffer.slice(offset, offset + samples * 2))
     }
   }
 }
@@ -215,9 +240,17 @@ export class MediaData extends Message {
     const type = data.readUInt32LE(0)
     if (type === MediaType.AlbumCover) {
       const imageData = data.subarray(4)
+      // Nothing may ever read the encoded form, so only build it on first
+      // read and keep it for later ones
+      let base64Image
       this.payload = {
         type,
-        base64Image: imageData.toString('base64'),
+        get base64Image() {
+          if (base64Image === undefined) {
+            base64Image = imageData.toString('base64')
+          }
+          return base64Image
+        },
       }
     } else if (type === MediaType.Data) {
       const mediaData = data.subarray(4, data.length - 1)
@@ -54,18 +54,14 @@ export class SendTouch extends SendableMessageWithPayload {
   }
 
   getPayload() {
-    const actionB = Buffer.alloc(4)
-    const xB = Buffer.alloc(4)
-    const yB = Buffer.alloc(4)
-    const flags = Buffer.alloc(4)
-    actionB.writeUInt32LE(this.action)
-
     const finalX = clamp(10000 * this.x, 0, 10000)
     const finalY = clamp(10000 * this.y, 0, 10000)
 
-    xB.writeUInt32LE(finalX)
-    yB.writeUInt32LE(finalY)
-    const data = Buffer.concat([actionB, xB, yB, flags])
+    // action, x, y, flags (left zeroed)
+    const data = Buffer.alloc(16)
+    data.writeUInt32LE(this.action, 0)
+    data.writeUInt32LE(finalX, 4)
+    data.writeUInt32LE(finalY, 8)
     return data
   }
 }
@@ -84,18 +80,13 @@ class TouchItem {
     this.id = id
   }
 
-  getPayload() {
-    const actionB = Buffer.alloc(4)
-    const xB = Buffer.alloc(4)
-    const yB = Buffer.alloc(4)
-    const idB = Buffer.alloc(4)
-    actionB.writeUInt32LE(this.action)
-    idB.writeUInt32LE(this.id)
-
-    xB.writeFloatLE(this.x)
-    yB.writeFloatLE(this.y)
-    const data = Buffer.concat([xB, yB, actionB, idB])
-    return data
+  static byteLength = 16
+
+  writeTo(data, offset) {
+    data.writeFloatLE(this.x, offset)
+    data.writeFloatLE(this.y, offset + 4)
+    data.writeUInt32LE(this.action, offset + 8)
+    data.writeUInt32LE(this.id, offset + 12)
   }
 }
 
@@ -109,7 +100,11 @@ export class SendMultiTouch extends SendableMessageWithPayload {
   }
 
   getPayload() {
-    const data = Buffer.concat(this.touches.map(i => i.getPayload()))
+    // Fixed-size records, written back to back into one buffer
+    const data = Buffer.alloc(this.touches.length * TouchItem.byteLength)
+    this.touches.forEach((touch, index) => {
+      touch.writeTo(data, index * TouchItem.byteLength)
+    })
     return data
   }
 }
@@ -122,11 +117,28 @@ export class SendAudio extends SendableMessageWithPayload {
   }
 
   getPayload() {
-    const audioData = Buffer.alloc(12)
-    audioData.writeUInt32LE(5, 0)
-    audioData.writeFloatLE(0.0, 4)
-    audioData.writeUInt32LE(3, 8)
-    return Buffer.concat([audioData, Buffer.from(this.data.buffer)])
+    return this.writePacket(0)
+  }
+
+  // Mic packets are sent continuously, so build header and payload in a
+  // single buffer rather than concatenating separate ones
+  serialise() {
+    return this.writePacket(MessageHeader.dataLength)
+  }
+
+  writePacket(offset) {
+    const { data } = this
+    const samples = Buffer.from(data.buffer, data.byteOffset, data.byteLength)
+    const payloadLength = 12 + samples.length
+    const packet = Buffer.allocUnsafe(offset + payloadLength)
+    if (offset > 0) {
+      MessageHeader.writeTo(packet, this.type, payloadLength)
+    }
+    packet.writeUInt32LE(5, offset)
+    packet.writeFloatLE(0.0, offset + 4)
+    packet.writeUInt32LE(3, offset + 8)
+    samples.copy(packet, offset + 12)
+    return packet
   }
 }
 
@@ -212,29 +224,15 @@ export class SendOpen extends SendableMessageWithPayload {
 
   getPayload() {
     const { config } = this
-    const width = Buffer.alloc(4)
-    width.writeUInt32LE(config.width)
-    const height = Buffer.alloc(4)
-    height.writeUInt32LE(config.height)
-    const fps = Buffer.alloc(4)
-    fps.writeUInt32LE(config.fps)
-    const format = Buffer.alloc(4)
-    format.writeUInt32LE(config.format)
-    const packetMax = Buffer.alloc(4)
-    packetMax.writeUInt32LE(config.packetMax)
-    const iBox = Buffer.alloc(4)
-    iBox.writeUInt32LE(config.iBoxVersion)
-    const phoneMode = Buffer.alloc(4)
-    phoneMode.writeUInt32LE(config.phoneWorkMode)
-    return Buffer.concat([
-      width,
-      height,
-      fps,
-      format,
-      packetMax,
-      iBox,
-      phoneMode,
-    ])
+    const data = Buffer.alloc(28)
+    data.writeUInt32LE(config.width, 0)
+    data.writeUInt32LE(config.height, 4)
+    data.writeUInt32LE(config.fps, 8)
+    data.writeUInt32LE(config.format, 12)
+    data.writeUInt32LE(config.packetMax, 16)
+    data.writeUInt32LE(config.iBoxVersion, 20)
+    data.writeUInt32LE(config.phoneWorkMode, 24)
+    return data
   }
 }
 
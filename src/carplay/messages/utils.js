@@ -7,4 +7,19 @@ export const clamp = (number, min, max) => {
 
 export function getCurrentTimeInMs() {
   return Math.round(Date.now() / 1000)
-}
\ No newline at end of file
+}
+
+// Printable ASCII maps to itself, everything else to a \xNN escape
+const ASCII_TABLE = Array.from({ length: 256 }, (_, b) =>
+  b >= 32 && b < 127
+    ? String.fromCharCode(b)
+    : `\\x${b.toString(16).padStart(2, '0')}`,
+)
+
+export function safeAscii(data) {
+  let out = ''
+  for (let i = 0; i < data.length; i++) {
+    out += ASCII_TABLE[data[i]]
+  }
+  return out
+}
@@ -1,4 +1,5 @@
 import CarPlayManager from './carplay-manager.js';
+import { DongleDriver, TouchAction, CommandMapping, CommandNames } from '../carplay/index.js';
 
 console.log('CarPlay module script loading...');
 
@@ -8,7 +9,6 @@ const radioInterface = document.getElementById('radioInterface');
 const carplayInterface = document.getElementById('carplayInterface');
 const settingsInterface = document.getElementById('settingsInterface');
 const navigationInterface = document.getElementById('navigationInterface');
-const appTiles = document.querySelectorAll('.app-tile');
 const backBtn = document.getElementById('backBtn');
 const settingsBackBtn = document.getElementById('settingsBackBtn');
 const navBackBtn = document.getElementById('navBackBtn');
@@ -73,8 +73,23 @@ const connectionText = document.getElementById('connectionText');
 const statusDot = document.getElementById('statusDot');
 const carplayStatus = document.querySelector('.carplay-status');
 
+// Fixed placeholder markup, built once; the failure reason is filled in as
+// text so it is never parsed as HTML
+const CONNECTING_PLACEHOLDER_HTML = '<div class="icon">📱</div><p>Connecting to device...</p>';
+const FAILED_PLACEHOLDER_HTML = '<div class="icon">⚠️</div><p class="placeholder-message"></p><p class="placeholder-hint">Please check your USB connection</p>';
+
 carplayManager.setVideoCanvas(carplayCanvas);
 
+// Swap the placeholder and the video canvas by visibility rather than
+// display, so switching between them repaints without a layout pass
+function setCarPlayVideoVisible(visible) {
+    carplayInterface.classList.toggle('video-active', visible);
+}
+
+function isCarPlayVideoVisible() {
+    return carplayInterface.classList.contains('video-active');
+}
+
 // Load settings to check debug mode
 const appSettings = ipcRenderer.sendSync('get-settings');
 const debugMode = appSettings.debug?.enabled || false;
@@ -94,10 +109,7 @@ async function checkForDongle() {
         }
 
         const devices = await navigator.usb.getDevices();
-        const carplayDevice = devices.find(d =>
-            (d.vendorId === 0x1314 && (d.productId === 0x1520 || d.productId === 0x1521)) ||
-            (d.vendorId === 0x05ac && d.productId === 0x12a8) // Carlinkit 5.0
-        );
+        const carplayDevice = DongleDriver.findKnownDevice(devices);
 
         if (!carplayDevice) {
             console.log('No CarPlay dongle found on startup');
@@ -115,16 +127,12 @@ function disableCarPlayButton() {
     // Disable the CarPlay tile
     const carplayTile = document.querySelector('.app-tile[data-app="phone"]');
     if (carplayTile) {
-        carplayTile.style.opacity = '0.5';
-        carplayTile.style.cursor = 'not-allowed';
-        carplayTile.style.pointerEvents = 'none';
+        carplayTile.classList.add('unavailable');
     }
 
     // Disable the nav button
     if (navBtns[3]) {
-        navBtns[3].style.opacity = '0.5';
-        navBtns[3].style.cursor = 'not-allowed';
-        navBtns[3].style.pointerEvents = 'none';
+        navBtns[3].classList.add('unavailable');
     }
 
     // Update CarPlay status
@@ -136,6 +144,13 @@ function disableCarPlayButton() {
 // Run the check on startup
 //checkForDongle();
 
+// Resolve the dongle while the UI is idle so tapping CarPlay connects sooner
+requestIdleCallback(() => {
+    carplayManager.prewarmDevice().catch((error) => {
+        console.warn('Could not prewarm CarPlay device:', error);
+    });
+});
+
 // CarPlay event handlers
 carplayManager.on('connected', () => {
     console.log('CarPlay connected event');
@@ -153,24 +168,24 @@ carplayManager.on('disconnected', () => {
     statusDot.classList.remove('connected');
     connectCarPlayBtn.disabled = false;
     connectCarPlayBtn.textContent = 'Connect Device';
-    carplayPlaceholder.style.display = 'block';
-    carplayCanvas.style.display = 'none';
+    setCarPlayVideoVisible(false);
     carplayInterface.classList.remove('fullscreen');
 });
 
 carplayManager.on('phone-plugged', (message) => {
     console.log('Phone plugged event:', message);
     carplayStatusText.textContent = 'iPhone connected!';
-    carplayPlaceholder.style.display = 'none';
-    carplayCanvas.style.display = 'block';
+    setCarPlayVideoVisible(true);
     // Go fullscreen when phone connects
     carplayInterface.classList.add('fullscreen');
 });
 
 carplayManager.on('video-frame', (videoData) => {
+    // Only the first frame of a stream needs to touch the DOM
+    if (isCarPlayVideoVisible()) return;
+
     // Show canvas when we start receiving video
-    carplayPlaceholder.style.display = 'none';
-    carplayCanvas.style.display = 'block';
+    setCarPlayVideoVisible(true);
     // Go fullscreen when video starts
     carplayInterface.classList.add('fullscreen');
 });
@@ -178,8 +193,7 @@ carplayManager.on('video-frame', (videoData) => {
 carplayManager.on('phone-unplugged', () => {
     console.log('Phone unplugged event');
     carplayStatusText.textContent = 'iPhone disconnected';
-    carplayPlaceholder.style.display = 'block';
-    carplayCanvas.style.display = 'none';
+    setCarPlayVideoVisible(false);
     carplayInterface.classList.remove('fullscreen');
 });
 
@@ -191,10 +205,9 @@ carplayManager.on('error', (message) => {
 });
 
 carplayManager.on('command', (command) => {
-    console.log('Command received:', command);
+    console.log('Command received:', CommandNames[command] ?? command);
 
-    // Check if it's the requestHostUI command (value 3)
-    if (command === 3) {
+    if (command === CommandMapping.requestHostUI) {
         console.log('RequestHostUI command received - switching to main UI');
         switchToMainUI();
     }
@@ -219,10 +232,21 @@ connectCarPlayBtn.addEventListener('click', async () => {
 let isMouseDown = false;
 let touchStartX = 0;
 let touchStartY = 0;
+// Canvas bounds, measured lazily and forgotten whenever the canvas is
+// resized (the CarPlay overlay is fixed, so it only moves by resizing)
+let canvasRect = null;
+new ResizeObserver(() => {
+    canvasRect = null;
+}).observe(carplayCanvas);
+
+function getCanvasRect() {
+    if (!canvasRect) {
+        canvasRect = carplayCanvas.getBoundingClientRect();
+    }
+    return canvasRect;
+}
 
 carplayCanvas.addEventListener('mousedown', async (e) => {
-    console.log('Canvas mousedown event fired');
-
     // Close dropdown if open
     if (quickSettingsDropdown.classList.contains('active')) {
         quickSettingsDropdown.classList.remove('active');
@@ -231,32 +255,26 @@ carplayCanvas.addEventListener('mousedown', async (e) => {
         return;
     }
 
-    if (!carplayManager.isConnected) {
-        console.log('CarPlay not connected, ignoring mousedown');
-        return;
-    }
+    if (!carplayManager.isConnected) return;
 
     isMouseDown = true;
-    const rect = carplayCanvas.getBoundingClientRect();
+    const rect = getCanvasRect();
     const x = (e.clientX - rect.left) / rect.width;
     const y = (e.clientY - rect.top) / rect.height;
 
-    console.log('Touch down at', x, y);
     touchStartX = x;
     touchStartY = y;
 
-    const { TouchAction } = await import('../carplay/index.js');
     await carplayManager.sendTouch(x, y, TouchAction.Down);
 });
 
 carplayCanvas.addEventListener('mousemove', async (e) => {
     if (!carplayManager.isConnected || !isMouseDown) return;
 
-    const rect = carplayCanvas.getBoundingClientRect();
+    const rect = getCanvasRect();
     const x = (e.clientX - rect.left) / rect.width;
     const y = (e.clientY - rect.top) / rect.height;
 
-    const { TouchAction } = await import('../carplay/index.js');
     await carplayManager.sendTouch(x, y, TouchAction.Move);
 });
 
@@ -264,11 +282,10 @@ carplayCanvas.addEventListener('mouseup', async (e) => {
     if (!carplayManager.isConnected) return;
 
     isMouseDown = false;
-    const rect = carplayCanvas.getBoundingClientRect();
+    const rect = getCanvasRect();
     const x = (e.clientX - rect.left) / rect.width;
     const y = (e.clientY - rect.top) / rect.height;
 
-    const { TouchAction } = await import('../carplay/index.js');
     await carplayManager.sendTouch(x, y, TouchAction.Up);
 });
 
@@ -277,18 +294,15 @@ carplayCanvas.addEventListener('mouseleave', async (e) => {
 
     // Send touch up if mouse leaves canvas while dragging
     isMouseDown = false;
-    const rect = carplayCanvas.getBoundingClientRect();
+    const rect = getCanvasRect();
     const x = (e.clientX - rect.left) / rect.width;
     const y = (e.clientY - rect.top) / rect.height;
 
-    const { TouchAction } = await import('../carplay/index.js');
     await carplayManager.sendTouch(x, y, TouchAction.Up);
 });
 
 // Touch events for mobile/tablet devices
 carplayCanvas.addEventListener('touchstart', async (e) => {
-    console.log('Canvas touchstart event fired');
-
     // Close dropdown if open
     if (quickSettingsDropdown.classList.contains('active')) {
         quickSettingsDropdown.classList.remove('active');
@@ -298,22 +312,17 @@ carplayCanvas.addEventListener('touchstart', async (e) => {
         return;
     }
 
-    if (!carplayManager.isConnected) {
-        console.log('CarPlay not connected, ignoring touchstart');
-        return;
-    }
+    if (!carplayManager.isConnected) return;
     e.preventDefault();
 
     const touch = e.touches[0];
-    const rect = carplayCanvas.getBoundingClientRect();
+    const rect = getCanvasRect();
     const x = (touch.clientX - rect.left) / rect.width;
     const y = (touch.clientY - rect.top) / rect.height;
 
-    console.log('Touch start at', x, y);
     touchStartX = x;
     touchStartY = y;
 
-    const { TouchAction } = await import('../carplay/index.js');
     await carplayManager.sendTouch(x, y, TouchAction.Down);
 });
 
@@ -322,11 +331,10 @@ carplayCanvas.addEventListener('touchmove', async (e) => {
     e.preventDefault();
 
     const touch = e.touches[0];
-    const rect = carplayCanvas.getBoundingClientRect();
+    const rect = getCanvasRect();
     const x = (touch.clientX - rect.left) / rect.width;
     const y = (touch.clientY - rect.top) / rect.height;
 
-    const { TouchAction } = await import('../carplay/index.js');
     await carplayManager.sendTouch(x, y, TouchAction.Move);
 });
 
@@ -335,11 +343,10 @@ carplayCanvas.addEventListener('touchend', async (e) => {
     e.preventDefault();
 
     const touch = e.changedTouches[0];
-    const rect = carplayCanvas.getBoundingClientRect();
+    const rect = getCanvasRect();
     const x = (touch.clientX - rect.left) / rect.width;
     const y = (touch.clientY - rect.top) / rect.height;
 
-    const { TouchAction } = await import('../carplay/index.js');
     await carplayManager.sendTouch(x, y, TouchAction.Up);
 });
 
@@ -348,11 +355,10 @@ carplayCanvas.addEventListener('touchcancel', async (e) => {
     e.preventDefault();
 
     const touch = e.changedTouches[0];
-    const rect = carplayCanvas.getBoundingClientRect();
+    const rect = getCanvasRect();
     const x = (touch.clientX - rect.left) / rect.width;
     const y = (touch.clientY - rect.top) / rect.height;
 
-    const { TouchAction } = await import('../carplay/index.js');
     await carplayManager.sendTouch(x, y, TouchAction.Up);
 });
 
@@ -362,6 +368,7 @@ function switchToMainUI() {
     carplayInterface.classList.remove('active');
     carplayInterface.classList.remove('fullscreen');
     homeScreen.style.display = 'grid';
+    carplayManager.setVisible(false);
 
     // Update nav bar
     navBtns.forEach(b => b.classList.remove('active'));
@@ -371,18 +378,21 @@ function switchToMainUI() {
 // Function to switch back to CarPlay UI
 function switchToCarPlayUI() {
     console.log('Switching to CarPlay UI');
-    homeScreen.style.display = 'none';
+    // CarPlay is a full-screen overlay, so the home screen stays laid out
+    // underneath (its rendering is skipped in CSS) and returning is instant
+    homeScreen.style.display = 'grid';
     carplayInterface.classList.add('active');
+    carplayManager.setVisible(true);
 
     // Auto-connect if not already connected and not in debug mode
     if (!carplayManager.isConnected && !debugMode) {
         console.log('Auto-connecting to CarPlay...');
-        carplayPlaceholder.innerHTML = '<div class="icon">📱</div><p>Connecting to device...</p>';
+        carplayPlaceholder.innerHTML = CONNECTING_PLACEHOLDER_HTML;
         connectCarPlay();
     }
 
     // If video is showing, go fullscreen
-    if (carplayCanvas.style.display === 'block') {
+    if (isCarPlayVideoVisible()) {
         carplayInterface.classList.add('fullscreen');
     }
 
@@ -397,155 +407,126 @@ async function connectCarPlay() {
         await carplayManager.connect();
     } catch (error) {
         console.error('Connection error:', error);
-        carplayPlaceholder.innerHTML = `<div class="icon">⚠️</div><p>Connection failed: ${error.message}</p><p style="font-size: 14px; margin-top: 10px;">Please check your USB connection</p>`;
+        carplayPlaceholder.innerHTML = FAILED_PLACEHOLDER_HTML;
+        carplayPlaceholder.querySelector('.placeholder-message').textContent = `Connection failed: ${error.message}`;
     }
 }
 
-// App tile navigation
-appTiles.forEach(tile => {
-    tile.addEventListener('click', () => {
-        const app = tile.getAttribute('data-app');
-        console.log('App tile clicked:', app);
-
-        // Hide all interfaces first
-        homeScreen.style.display = 'none';
-        radioInterface.classList.remove('active');
-        carplayInterface.classList.remove('active');
-        carplayInterface.classList.remove('fullscreen');
-        settingsInterface.classList.remove('active');
-        musicInterface.classList.remove('active');
-        navigationInterface.classList.remove('active');
-
-        // Hide keyboard and context menu when switching interfaces
-        const keyboard = document.getElementById('onscreenKeyboard');
-        const contextMenu = document.getElementById('trackContextMenu');
-        if (keyboard) keyboard.style.display = 'none';
-        if (contextMenu) contextMenu.style.display = 'none';
-
-        if (app === 'radio') {
-            console.log('Opening radio interface');
-            radioInterface.classList.add('active');
-        } else if (app === 'phone') {
-            console.log('Opening CarPlay interface');
-            switchToCarPlayUI();
-        } else if (app === 'settings') {
-            console.log('Opening settings interface');
-            settingsInterface.classList.add('active');
-            loadSettings();
-        } else if (app === 'media') {
-            console.log('Opening music interface');
-            musicInterface.classList.add('active');
-            initMusicPlayer();
-        } else if (app === 'navigation') {
-            console.log('Opening navigation interface');
-            navigationInterface.classList.add('active');
-            initNavigation();
-        }
-    });
-});
-
-const musicBackBtn = document.getElementById('musicBackBtn');
-musicBackBtn.addEventListener('click', () => {
-    console.log('Closing music interface');
+// The music player's on-screen keyboard and track menu float above every
+// interface, so they are closed whenever the user switches away
+const onscreenKeyboard = document.getElementById('onscreenKeyboard');
+const trackContextMenu = document.getElementById('trackContextMenu');
 
-    // Hide keyboard and context menu when leaving music interface
-    const keyboard = document.getElementById('onscreenKeyboard');
-    const contextMenu = document.getElementById('trackContextMenu');
-    if (keyboard) keyboard.style.display = 'none';
-    if (contextMenu) contextMenu.style.display = 'none';
+function hideMusicOverlays() {
+    if (onscreenKeyboard) onscreenKeyboard.style.display = 'none';
+    if (trackContextMenu) trackContextMenu.style.display = 'none';
+}
 
+// Shared first step of every tile and nav bar switch
+function hideAllInterfaces() {
+    homeScreen.style.display = 'none';
+    radioInterface.classList.remove('active');
+    carplayInterface.classList.remove('active');
+    carplayInterface.classList.remove('fullscreen');
+    carplayManager.setVisible(false);
+    settingsInterface.classList.remove('active');
     musicInterface.classList.remove('active');
-    homeScreen.style.display = 'grid';
-});
-
-// Navigation back button
-navBackBtn.addEventListener('click', () => {
-    console.log('Closing navigation interface');
     navigationInterface.classList.remove('active');
-    homeScreen.style.display = 'grid';
 
-    // Update nav bar
-    navBtns.forEach(b => b.classList.remove('active'));
-    navBtns[0].classList.add('active'); // Activate home button
-});
+    hideMusicOverlays();
+}
 
-// Back buttons
-backBtn.addEventListener('click', () => {
-    console.log('Radio back button clicked');
-    radioInterface.classList.remove('active');
-    homeScreen.style.display = 'grid';
-    ipcRenderer.send('stop-radio');
+// What each home screen tile opens, keyed by its data-app attribute
+const appOpeners = {
+    radio: () => {
+        radioInterface.classList.add('active');
+    },
+    phone: () => {
+        switchToCarPlayUI();
+    },
+    settings: () => {
+        settingsInterface.classList.add('active');
+        loadSettings();
+    },
+    media: () => {
+        musicInterface.classList.add('active');
+        initMusicPlayer();
+    },
+    navigation: () => {
+        navigationInterface.classList.add('active');
+        initNavigation();
+    }
+};
 
-    // Hide any music interface overlays
-    const keyboard = document.getElementById('onscreenKeyboard');
-    const contextMenu = document.getElementById('trackContextMenu');
-    if (keyboard) keyboard.style.display = 'none';
-    if (contextMenu) contextMenu.style.display = 'none';
+// App tile navigation, through one delegated listener on the home screen
+homeScreen.addEventListener('click', (e) => {
+    const tile = e.target.closest('.app-tile');
+    if (!tile) return;
 
-    // Update nav bar
-    navBtns.forEach(b => b.classList.remove('active'));
-    navBtns[0].classList.add('active'); // Activate home button
+    const app = tile.getAttribute('data-app');
+
+    hideAllInterfaces();
+
+    const openApp = appOpeners[app];
+    if (openApp) {
+        openApp();
+    }
 });
 
-settingsBackBtn.addEventListener('click', () => {
-    console.log('Settings back button clicked');
-    settingsInterface.classList.remove('active');
+// Back buttons all close their interface and return to the home screen
+function returnToHome(activeInterface) {
+    activeInterface.classList.remove('active');
     homeScreen.style.display = 'grid';
 
-    // Hide any music interface overlays
-    const keyboard = document.getElementById('onscreenKeyboard');
-    const contextMenu = document.getElementById('trackContextMenu');
-    if (keyboard) keyboard.style.display = 'none';
-    if (contextMenu) contextMenu.style.display = 'none';
+    hideMusicOverlays();
 
     // Update nav bar
     navBtns.forEach(b => b.classList.remove('active'));
     navBtns[0].classList.add('active'); // Activate home button
+}
+
+const musicBackBtn = document.getElementById('musicBackBtn');
+musicBackBtn.addEventListener('click', () => returnToHome(musicInterface));
+navBackBtn.addEventListener('click', () => returnToHome(navigationInterface));
+settingsBackBtn.addEventListener('click', () => returnToHome(settingsInterface));
+backBtn.addEventListener('click', () => {
+    returnToHome(radioInterface);
+    ipcRenderer.send('stop-radio');
 });
 
-// Bottom navigation bar
-navBtns.forEach((btn, index) => {
-    btn.addEventListener('click', () => {
-        // Remove active class from all nav buttons
-        navBtns.forEach(b => b.classList.remove('active'));
-        btn.classList.add('active');
+// Bottom navigation bar: one delegated listener for all buttons
+const navBar = document.querySelector('.nav-bar');
+navBar.addEventListener('click', (e) => {
+    const btn = e.target.closest('.nav-btn');
+    if (!btn) return;
+    const index = Array.prototype.indexOf.call(navBtns, btn);
 
-        // Hide all interfaces
-        homeScreen.style.display = 'none';
-        radioInterface.classList.remove('active');
-        carplayInterface.classList.remove('active');
-        carplayInterface.classList.remove('fullscreen');
-        settingsInterface.classList.remove('active');
-        musicInterface.classList.remove('active');
-        navigationInterface.classList.remove('active');
-
-        // Hide keyboard and context menu when switching interfaces
-        const keyboard = document.getElementById('onscreenKeyboard');
-        const contextMenu = document.getElementById('trackContextMenu');
-        if (keyboard) keyboard.style.display = 'none';
-        if (contextMenu) contextMenu.style.display = 'none';
-
-        // Show appropriate screen based on button index
-        switch (index) {
-            case 0: // Home
-                homeScreen.style.display = 'grid';
-                break;
-            case 1: // Navigation
-                navigationInterface.classList.add('active');
-                initNavigation();
-                break;
-            case 2: // Media/Radio
-                radioInterface.classList.add('active');
-                break;
-            case 3: // Phone/CarPlay
-                switchToCarPlayUI();
-                break;
-            case 4: // Settings
-                settingsInterface.classList.add('active');
-                loadSettings();
-                break;
-        }
-    });
+    // Remove active class from all nav buttons
+    navBtns.forEach(b => b.classList.remove('active'));
+    btn.classList.add('active');
+
+    hideAllInterfaces();
+
+    // Show appropriate screen based on button index
+    switch (index) {
+        case 0: // Home
+            homeScreen.style.display = 'grid';
+            break;
+        case 1: // Navigation
+            navigationInterface.classList.add('active');
+            initNavigation();
+            break;
+        case 2: // Media/Radio
+            radioInterface.classList.add('active');
+            break;
+        case 3: // Phone/CarPlay
+            switchToCarPlayUI();
+            break;
+        case 4: // Settings
+            settingsInterface.classList.add('active');
+            loadSettings();
+            break;
+    }
 });
 
 // Radio functionality
@@ -660,24 +641,55 @@ function loadSettings() {
     document.getElementById('carplayBoxName').value = settings.carplay.boxName || 'nodePlay';
     document.getElementById('carplayHand').value = settings.carplay.hand !== undefined ? settings.carplay.hand : 0;
 
-    // Load radio presets
+    // Load radio presets. The editor rows are built once and then only have
+    // their labels and values refreshed, unless the number of presets changes
     const presetsEditor = document.getElementById('presetsEditor');
-    presetsEditor.innerHTML = '';
-    settings.radio.presets.forEach((preset, index) => {
-        const presetItem = document.createElement('div');
-        presetItem.className = 'preset-editor-item';
-        presetItem.innerHTML = `
-            <label>Preset ${preset.number}</label>
-            <input type="number" step="0.1" min="87.5" max="108.0"
-                   value="${preset.frequency}"
-                   data-preset="${index}">
-        `;
-        presetsEditor.appendChild(presetItem);
-    });
+    const presetItems = presetsEditor.querySelectorAll('.preset-editor-item');
+    if (presetItems.length === settings.radio.presets.length) {
+        settings.radio.presets.forEach((preset, index) => {
+            const item = presetItems[index];
+            item.querySelector('label').textContent = `Preset ${preset.number}`;
+            item.querySelector('input').value = preset.frequency;
+        });
+    } else {
+        presetsEditor.innerHTML = '';
+        settings.radio.presets.forEach((preset, index) => {
+            const presetItem = document.createElement('div');
+            presetItem.className = 'preset-editor-item';
+            presetItem.innerHTML = `
+                <label>Preset ${preset.number}</label>
+                <input type="number" step="0.1" min="87.5" max="108.0"
+                       value="${preset.frequency}"
+                       data-preset="${index}">
+            `;
+            presetsEditor.appendChild(presetItem);
+        });
+    }
+}
+
+// Transient settings messages clear themselves after a few seconds. Only
+// one clear is ever pending, so a newer message is never wiped early by
+// an older message's timer
+const SETTINGS_STATUS_TIMEOUT = 5000;
+let settingsStatusTimer = null;
+
+function showSettingsStatus(statusDiv, text, className, autoClear = true) {
+    clearTimeout(settingsStatusTimer);
+    settingsStatusTimer = null;
+
+    statusDiv.textContent = text;
+    statusDiv.className = className;
+
+    if (autoClear) {
+        settingsStatusTimer = setTimeout(() => {
+            settingsStatusTimer = null;
+            statusDiv.textContent = '';
+            statusDiv.className = 'settings-status';
+        }, SETTINGS_STATUS_TIMEOUT);
+    }
 }
 
 function saveSettings() {
-    console.log('saveSettings() called');
     const settings = {
         'window.width': parseInt(document.getElementById('windowWidth').value),
         'window.height': parseInt(document.getElementById('windowHeight').value),
@@ -720,15 +732,11 @@ function saveSettings() {
     });
     settings['radio.presets'] = presets;
 
-    console.log('Settings to save:', settings);
-    console.log('Calling ipcRenderer.sendSync update-settings');
     const success = ipcRenderer.sendSync('update-settings', settings);
-    console.log('IPC returned:', success);
 
     const statusDiv = document.getElementById('settingsStatus');
     if (success) {
-        statusDiv.textContent = 'Settings saved successfully! Restart CarPlay connection for changes to take effect.';
-        statusDiv.className = 'settings-status success';
+        showSettingsStatus(statusDiv, 'Settings saved successfully! Restart CarPlay connection for changes to take effect.', 'settings-status success');
 
         // Notify the controls script about settings update
         ipcRenderer.send('notify-settings-updated');
@@ -736,14 +744,8 @@ function saveSettings() {
         // Update radio presets in UI
         updateRadioPresets();
     } else {
-        statusDiv.textContent = 'Failed to save settings';
-        statusDiv.className = 'settings-status error';
+        showSettingsStatus(statusDiv, 'Failed to save settings', 'settings-status error');
     }
-
-    setTimeout(() => {
-        statusDiv.textContent = '';
-        statusDiv.className = 'settings-status';
-    }, 5000);
 }
 
 function updateRadioPresets() {
@@ -764,13 +766,10 @@ document.getElementById('saveSettingsBtn').addEventListener('click', saveSetting
 const selectMusicFolderBtn = document.getElementById('selectMusicFolderBtn');
 if (selectMusicFolderBtn) {
     selectMusicFolderBtn.addEventListener('click', async () => {
-        console.log('Select music folder button clicked');
         try {
             // Use ipcRenderer directly (available as global from controls.js)
             if (typeof ipcRenderer !== 'undefined') {
-                console.log('Using ipcRenderer to select folder');
                 const result = await ipcRenderer.invoke('select-music-folder');
-                console.log('Folder selection result:', result);
                 if (!result.canceled && result.filePaths && result.filePaths.length > 0) {
                     const folderPath = result.filePaths[0];
                     document.getElementById('musicFolderSetting').value = folderPath;
@@ -785,8 +784,7 @@ if (selectMusicFolderBtn) {
                     // Show scanning status
                     const statusDiv = document.getElementById('settingsStatus');
                     if (statusDiv) {
-                        statusDiv.textContent = 'Scanning music library...';
-                        statusDiv.className = 'settings-status';
+                        showSettingsStatus(statusDiv, 'Scanning music library...', 'settings-status', false);
                     }
 
                     // Trigger library scan immediately
@@ -798,22 +796,12 @@ if (selectMusicFolderBtn) {
 
                         // Show success with file count
                         if (statusDiv) {
-                            statusDiv.textContent = `Music folder saved! Found ${fileCount} audio file${fileCount !== 1 ? 's' : ''}.`;
-                            statusDiv.className = 'settings-status success';
-                            setTimeout(() => {
-                                statusDiv.textContent = '';
-                                statusDiv.className = 'settings-status';
-                            }, 5000);
+                            showSettingsStatus(statusDiv, `Music folder saved! Found ${fileCount} audio file${fileCount !== 1 ? 's' : ''}.`, 'settings-status success');
                         }
                     } catch (scanError) {
                         console.error('Error scanning library:', scanError);
                         if (statusDiv) {
-                            statusDiv.textContent = 'Music folder saved, but scan failed. Try opening Media Player.';
-                            statusDiv.className = 'settings-status';
-                            setTimeout(() => {
-                                statusDiv.textContent = '';
-                                statusDiv.className = 'settings-status';
-                            }, 5000);
+                            showSettingsStatus(statusDiv, 'Music folder saved, but scan failed. Try opening Media Player.', 'settings-status');
                         }
                     }
                 }
@@ -834,7 +822,6 @@ document.getElementById('resetSettingsBtn').addEventListener('click', () => {
     if (confirm('Are you sure you want to reset all settings to defaults?')) {
         loadSettings();
         const statusDiv = document.getElementById('settingsStatus');
-        statusDiv.textContent = 'Settings reset to current saved values. To reset to defaults, manually edit config.json';
-        statusDiv.className = 'settings-status';
+        showSettingsStatus(statusDiv, 'Settings reset to current saved values. To reset to defaults, manually edit config.json', 'settings-status', false);
     }
 });
\ No newline at end of file
@@ -1,6 +1,43 @@
-import { DongleDriver, DEFAULT_CONFIG, PhoneType, decodeTypeMap } from '../carplay/index.js';
+import {
+  DongleDriver,
+  DEFAULT_CONFIG,
+  PhoneType,
+  PhoneTypeNames,
+  decodeTypeMap,
+  VideoData,
+  AudioData,
+  Plugged,
+  Unplugged,
+  MediaData,
+  Command,
+  Opened,
+  SendAudio,
+  SendTouch,
+  SendCommand,
+  TouchAction,
+} from '../carplay/index.js';
 import { EventEmitter } from '../carplay/eventEmitter.js';
 
+// H.264 Baseline Profile Level 3.1
+const VIDEO_CODEC = 'avc1.64001f';
+
+// Chunks allowed to wait in the decoder before deltas are dropped
+const MAX_DECODE_QUEUE_SIZE = 3;
+// How long to wait for a requested keyframe before asking again, in ms
+const KEY_FRAME_RETRY_INTERVAL = 500;
+
+// Minimum time between forwarded touch moves, in ms (caps drags at 100 Hz)
+const TOUCH_MOVE_INTERVAL = 10;
+
+// Minimum time between reports of the same per-packet error, in ms
+const ERROR_LOG_INTERVAL = 1000;
+
+// Fonts for the decoder-unavailable placeholder, defined once and reused
+const PLACEHOLDER_TITLE_FONT = '24px -apple-system, BlinkMacSystemFont, sans-serif';
+const PLACEHOLDER_BODY_FONT = '16px -apple-system, BlinkMacSystemFont, sans-serif';
+
+// Scale factor from signed 16-bit PCM to the [-1, 1) floats WebAudio uses
+const INT16_TO_FLOAT = 1 / 32768;
 
 class CarPlayManager extends EventEmitter {
   constructor() {
@@ -9,12 +46,47 @@ class CarPlayManager extends EventEmitter {
     this.device = null;
     this.isConnected = false;
     this.videoCanvas = null;
+    this.videoContext = null;
     this.audioContext = null;
+    this.nextAudioTime = null;
     this.videoDecoder = null;
+    this.pendingFrame = null;
+    this.frameRequestId = null;
+    // Created once so scheduling a draw does not allocate a closure per frame
+    this.drawFrameCallback = () => this.drawPendingFrame();
+    this.isVisible = true;
+    this.waitingForKeyFrame = false;
+    this.keyFrameRequestedAt = 0;
+    this.placeholderKey = null;
+    this.videoAcceleration = null;
+    this.errorLog = new Map();
+    this.lastTouchTime = 0;
+    this.lastTouchX = null;
+    this.lastTouchY = null;
     this.frameCount = 0;
     this.micStream = null;
     this.micProcessor = null;
 
+    // Message handlers keyed by message class, so dispatch is one lookup
+    this.messageHandlers = new Map([
+      [VideoData, (message) => this.handleVideoFrame(message)],
+      [AudioData, (message) => this.handleAudioData(message)],
+      [Plugged, (message) => {
+        this.emit('phone-plugged', message);
+        console.log('Phone plugged:', PhoneTypeNames[message.phoneType] ?? message.phoneType);
+      }],
+      [Unplugged, () => {
+        this.emit('phone-unplugged');
+        console.log('Phone unplugged');
+      }],
+      [MediaData, (message) => this.emit('media-data', message.payload)],
+      [Command, (message) => this.emit('command', message.value)],
+      [Opened, (message) => {
+        console.log('CarPlay opened:', message);
+        this.emit('carplay-opened', message);
+      }],
+    ]);
+
     // Load settings from config
     let settings = null;
     try {
@@ -43,10 +115,25 @@ class CarPlayManager extends EventEmitter {
     };
 
     this.settings = settings;
+    this.debug = settings?.debug?.enabled === true;
 
     console.log('CarPlay Manager initialized with config:', this.config);
   }
 
+  // Look up an already-authorised dongle ahead of time, so the first
+  // connect() does not have to wait on the USB device list
+  async prewarmDevice() {
+    if (this.device || !navigator.usb) return;
+
+    const devices = await navigator.usb.getDevices();
+    const carplayDevice = DongleDriver.findKnownDevice(devices);
+
+    if (carplayDevice && !this.device) {
+      console.log('Prewarmed CarPlay device:', carplayDevice);
+      this.device = carplayDevice;
+    }
+  }
+
   async requestDevice() {
     try {
       console.log('Checking WebUSB support...');
@@ -60,17 +147,11 @@ class CarPlayManager extends EventEmitter {
       const devices = await navigator.usb.getDevices();
       console.log('Already authorized devices:', devices);
 
-      if (devices.length > 0) {
-        const carplayDevice = devices.find(d =>
-          (d.vendorId === 0x1314 && (d.productId === 0x1520 || d.productId === 0x1521)) ||
-          (d.vendorId === 0x05ac && d.productId === 0x12a8) // Carlinkit 5.0
-        );
-
-        if (carplayDevice) {
-          console.log('Found previously authorized CarPlay device:', carplayDevice);
-          this.device = carplayDevice;
-          return carplayDevice;
-        }
+      const carplayDevice = DongleDriver.findKnownDevice(devices);
+      if (carplayDevice) {
+        console.log('Found previously authorized CarPlay device:', carplayDevice);
+        this.device = carplayDevice;
+        return carplayDevice;
       }
 
       console.log('Showing device picker dialog...');
@@ -107,7 +188,7 @@ class CarPlayManager extends EventEmitter {
       await this.device.open();
       console.log('Device opened successfully');
 
-      this.driver = new DongleDriver();
+      this.driver = new DongleDriver({ debug: this.debug });
       console.log('Initializing dongle driver...');
       await this.driver.initialise(this.device);
       console.log('Driver initialized');
@@ -116,6 +197,10 @@ class CarPlayManager extends EventEmitter {
       this.driver.on('message', this.handleMessage.bind(this));
       this.driver.on('failure', this.handleFailure.bind(this));
 
+      // Decide on hardware decoding before any video can arrive, so the
+      // decoder can still be configured synchronously on the first frame
+      await this.probeVideoAcceleration();
+
       // Start the driver
       console.log('Starting driver with config:', this.config);
       await this.driver.start(this.config);
@@ -132,49 +217,42 @@ class CarPlayManager extends EventEmitter {
       return true;
     } catch (error) {
       console.error('Failed to connect to CarPlay dongle:', error);
+      // The cached device may be stale (e.g. the dongle was replugged), so
+      // look it up again on the next attempt
+      this.device = null;
       this.emit('error', error.message);
       return false;
     }
   }
 
   handleMessage(message) {
-    const messageType = message.constructor.name;
-
-    switch (messageType) {
-      case 'Plugged':
-        this.emit('phone-plugged', message);
-        console.log('Phone plugged:', message.phoneType);
-        break;
-
-      case 'Unplugged':
-        this.emit('phone-unplugged');
-        console.log('Phone unplugged');
-        break;
+    const handler = this.messageHandlers.get(message.constructor);
 
-      case 'VideoData':
-        this.handleVideoFrame(message);
-        break;
-
-      case 'AudioData':
-        this.handleAudioData(message);
-        break;
-
-      case 'MediaData':
-        this.emit('media-data', message.payload);
-        break;
+    if (handler) {
+      handler(message);
+    } else {
+      console.log('Unhandled message:', message.constructor.name);
+    }
+  }
 
-      case 'Command':
-        this.emit('command', message.value);
-        break;
+  async probeVideoAcceleration() {
+    if (this.videoAcceleration || !window.VideoDecoder) return;
 
-      case 'Opened':
-        console.log('CarPlay opened:', message);
-        this.emit('carplay-opened', message);
-        break;
-
-      default:
-        console.log('Unhandled message:', messageType);
+    // Chromium treats prefer-hardware as a hard requirement, so only ask
+    // for it when a hardware H.264 decoder is actually available
+    try {
+      const { supported } = await VideoDecoder.isConfigSupported({
+        codec: VIDEO_CODEC,
+        codedWidth: this.config.width,
+        codedHeight: this.config.height,
+        hardwareAcceleration: 'prefer-hardware'
+      });
+      this.videoAcceleration = supported ? 'prefer-hardware' : 'no-preference';
+    } catch (error) {
+      console.warn('Could not probe hardware video decoding:', error);
+      this.videoAcceleration = 'no-preference';
     }
+    console.log('Video decoder acceleration:', this.videoAcceleration);
   }
 
   async initializeVideoDecoder(width, height) {
@@ -188,22 +266,19 @@ class CarPlayManager extends EventEmitter {
       return;
     }
 
-    const canvas = this.videoCanvas;
-    const ctx = canvas.getContext('2d');
-
-    // Set canvas to match video resolution
-    canvas.width = width;
-    canvas.height = height;
+    // Set canvas to match video resolution so frames blit 1:1; the CSS
+    // object-fit scaling is done by the compositor instead of resampling
+    // every frame in drawImage
+    this.resizeVideoCanvas(width, height);
 
     this.videoDecoder = new VideoDecoder({
       output: (frame) => {
-        // Draw the decoded frame to the canvas
-        try {
-          ctx.drawImage(frame, 0, 0, canvas.width, canvas.height);
-          frame.close();
-        } catch (error) {
-          console.error('Error drawing frame:', error);
+        // Keep only the newest decoded frame; one that was never drawn is stale
+        if (this.pendingFrame) {
+          this.pendingFrame.close();
         }
+        this.pendingFrame = frame;
+        this.scheduleDraw();
       },
       error: (error) => {
         console.error('VideoDecoder error:', error);
@@ -212,10 +287,11 @@ class CarPlayManager extends EventEmitter {
 
     // Configure the decoder for H.264
     const config = {
-      codec: 'avc1.64001f', // H.264 Baseline Profile Level 3.1
+      codec: VIDEO_CODEC,
       codedWidth: width,
       codedHeight: height,
-      optimizeForLatency: true
+      optimizeForLatency: true,
+      hardwareAcceleration: this.videoAcceleration || 'no-preference'
     };
 
     try {
@@ -227,6 +303,60 @@ class CarPlayManager extends EventEmitter {
     }
   }
 
+  scheduleDraw() {
+    // While the CarPlay view is hidden the decoder keeps running (later
+    // deltas depend on earlier frames) but nothing is drawn; the newest
+    // frame is kept and drawn as soon as the view is shown again
+    if (this.isVisible && this.frameRequestId === null) {
+      this.frameRequestId = requestAnimationFrame(this.drawFrameCallback);
+    }
+  }
+
+  setVisible(visible) {
+    this.isVisible = visible;
+
+    if (visible) {
+      this.scheduleDraw();
+    } else if (this.frameRequestId !== null) {
+      cancelAnimationFrame(this.frameRequestId);
+      this.frameRequestId = null;
+    }
+  }
+
+  drawPendingFrame() {
+    this.frameRequestId = null;
+
+    const frame = this.pendingFrame;
+    if (!frame) return;
+    this.pendingFrame = null;
+
+    // Draw the decoded frame to the canvas
+    try {
+      // Only touch the backing store when the stream size actually changes;
+      // assigning canvas.width/height reallocates and clears it
+      const canvas = this.videoCanvas;
+      if (canvas.width !== frame.displayWidth || canvas.height !== frame.displayHeight) {
+        this.resizeVideoCanvas(frame.displayWidth, frame.displayHeight);
+      }
+
+      this.videoContext.drawImage(frame, 0, 0);
+      this.placeholderKey = null;
+    } catch (error) {
+      this.logStreamError('Error drawing frame:', error);
+    } finally {
+      frame.close();
+    }
+  }
+
+  resizeVideoCanvas(width, height) {
+    this.videoCanvas.width = width;
+    this.videoCanvas.height = height;
+
+    // Resizing resets the context state. Frames are drawn unscaled, so
+    // skip the smoothing filter; any scaling happens in the compositor
+    this.videoContext.imageSmoothingEnabled = false;
+  }
+
   handleVideoFrame(videoData) {
     if (!this.videoCanvas) return;
 
@@ -241,21 +371,45 @@ class CarPlayManager extends EventEmitter {
     }
 
     try {
-      // Create an EncodedVideoChunk from the H.264 data
-      const chunk = new EncodedVideoChunk({
-        type: (videoData.flags & 1) ? 'key' : 'delta', // Check if it's a keyframe
-        timestamp: performance.now() * 1000, // Convert to microseconds
-        data: videoData.data
-      });
+      const type = (videoData.flags & 1) ? 'key' : 'delta'; // Check if it's a keyframe
+
+      // If the decoder falls behind, skip deltas until the next keyframe
+      // (and ask the phone for one) instead of queueing stale frames
+      if (type === 'delta' &&
+          (this.waitingForKeyFrame || this.videoDecoder.decodeQueueSize > MAX_DECODE_QUEUE_SIZE)) {
+        // Keep asking until a keyframe arrives: a lost or ignored request
+        // would otherwise leave the video frozen
+        const now = performance.now();
+        if (!this.waitingForKeyFrame ||
+            now - this.keyFrameRequestedAt >= KEY_FRAME_RETRY_INTERVAL) {
+          this.waitingForKeyFrame = true;
+          this.keyFrameRequestedAt = now;
+          this.sendCommand('frame').then((sent) => {
+            // A failed transfer is retried on the next skipped delta. A null
+            // result means the device is not open, so wait out the interval
+            // rather than hammering it on every frame
+            if (sent === false) this.keyFrameRequestedAt = 0;
+          });
+        }
+      } else {
+        this.waitingForKeyFrame = false;
 
-      // Decode the chunk
-      this.videoDecoder.decode(chunk);
+        // Create an EncodedVideoChunk from the H.264 data
+        const chunk = new EncodedVideoChunk({
+          type,
+          timestamp: performance.now() * 1000, // Convert to microseconds
+          data: videoData.data
+        });
 
-      // Track FPS
-      this.frameCount++;
+        // Decode the chunk
+        this.videoDecoder.decode(chunk);
+
+        // Track FPS
+        this.frameCount++;
+      }
 
     } catch (error) {
-      console.error('Error decoding video frame:', error);
+      this.logStreamError('Error decoding video frame:', error);
       // Show placeholder on error
       this.showPlaceholder(videoData);
     }
@@ -264,21 +418,25 @@ class CarPlayManager extends EventEmitter {
   }
 
   showPlaceholder(videoData) {
-    const ctx = this.videoCanvas.getContext('2d');
+    const ctx = this.videoContext;
+    const canvas = this.videoCanvas;
 
-    if (!this.lastPlaceholderUpdate || Date.now() - this.lastPlaceholderUpdate > 100) {
-      this.lastPlaceholderUpdate = Date.now();
+    // The placeholder is static text, so only redraw it when what it shows
+    // (or the canvas it is drawn on) has changed
+    const key = `${videoData.width}x${videoData.height}@${canvas.width}x${canvas.height}`;
+    if (key !== this.placeholderKey) {
+      this.placeholderKey = key;
 
       ctx.fillStyle = '#0a0a0a';
       ctx.fillRect(0, 0, this.videoCanvas.width, this.videoCanvas.height);
 
       ctx.fillStyle = '#ff8800';
-      ctx.font = '24px -apple-system, BlinkMacSystemFont, sans-serif';
+      ctx.font = PLACEHOLDER_TITLE_FONT;
       ctx.textAlign = 'center';
       ctx.fillText('⚠️ Video Decoder Unavailable', this.videoCanvas.width / 2, 100);
 
       ctx.fillStyle = '#888';
-      ctx.font = '16px -apple-system, BlinkMacSystemFont, sans-serif';
+      ctx.font = PLACEHOLDER_BODY_FONT;
       ctx.fillText(`Receiving data: ${videoData.width}x${videoData.height}`, this.videoCanvas.width / 2, 140);
       ctx.fillText('WebCodecs API required for video display', this.videoCanvas.width / 2, 170);
     }
@@ -310,19 +468,21 @@ class CarPlayManager extends EventEmitter {
         );
 
         // De-interleave correctly based on channel count
+        const samples = audioData.data;
         if (channels === 1) {
           // Mono
           const channelData = audioBuffer.getChannelData(0);
           for (let i = 0; i < frameCount; i++) {
-            channelData[i] = audioData.data[i] / 32768.0;
+            channelData[i] = samples[i] * INT16_TO_FLOAT;
           }
         } else {
-          // Stereo
-          for (let channel = 0; channel < 2; channel++) {
-            const channelData = audioBuffer.getChannelData(channel);
-            for (let i = 0; i < frameCount; i++) {
-              channelData[i] = audioData.data[i * 2 + channel] / 32768.0;
-            }
+          // Stereo: one sequential pass over the interleaved samples
+          // fills both planar channels
+          const left = audioBuffer.getChannelData(0);
+          const right = audioBuffer.getChannelData(1);
+          for (let i = 0, j = 0; i < frameCount; i++, j += 2) {
+            left[i] = samples[j] * INT16_TO_FLOAT;
+            right[i] = samples[j + 1] * INT16_TO_FLOAT;
           }
         }
 
@@ -341,7 +501,7 @@ class CarPlayManager extends EventEmitter {
         this.nextAudioTime += audioBuffer.duration;
 
       } catch (error) {
-        console.error('Audio playback error:', error);
+        this.logStreamError('Audio playback error:', error);
       }
     }
   }
@@ -399,6 +559,7 @@ class CarPlayManager extends EventEmitter {
       this.micProcessor = this.audioContext.createScriptProcessor(bufferSize, 1, 1);
 
       let packetCount = 0;
+      let int16Data = null;
       this.micProcessor.onaudioprocess = (audioProcessingEvent) => {
         if (!this.driver || !this.isConnected) return;
 
@@ -407,40 +568,34 @@ class CarPlayManager extends EventEmitter {
 
         // Resample to 16kHz if needed
         const targetSampleRate = 16000;
-        const sourceSampleRate = this.audioContext.sampleRate;
-        let resampledData;
+        const ratio = this.audioContext.sampleRate / targetSampleRate;
+        const targetLength = Math.floor(inputData.length / ratio);
+
+        // Reuse one int16 buffer across callbacks. The packet is serialised,
+        // copying the samples out, as soon as sendMicrophoneAudio() reaches
+        // driver.send(), long before the next callback refills the buffer
+        if (!int16Data || int16Data.length !== targetLength) {
+          int16Data = new Int16Array(targetLength);
+        }
 
-        if (sourceSampleRate !== targetSampleRate) {
+        for (let i = 0; i < targetLength; i++) {
           // Simple linear interpolation resampling
-          const ratio = sourceSampleRate / targetSampleRate;
-          const targetLength = Math.floor(inputData.length / ratio);
-          resampledData = new Float32Array(targetLength);
-
-          for (let i = 0; i < targetLength; i++) {
-            const sourceIndex = i * ratio;
-            const index = Math.floor(sourceIndex);
-            const fraction = sourceIndex - index;
-
-            if (index + 1 < inputData.length) {
-              resampledData[i] = inputData[index] * (1 - fraction) + inputData[index + 1] * fraction;
-            } else {
-              resampledData[i] = inputData[index];
-            }
+          const sourceIndex = i * ratio;
+          const index = Math.floor(sourceIndex);
+          const fraction = sourceIndex - index;
+
+          let sample = inputData[index];
+          if (fraction !== 0 && index + 1 < inputData.length) {
+            sample = sample * (1 - fraction) + inputData[index + 1] * fraction;
           }
-        } else {
-          resampledData = inputData;
-        }
 
-        // Convert float32 audio data to int16 for CarPlay
-        const int16Data = new Int16Array(resampledData.length);
-        for (let i = 0; i < resampledData.length; i++) {
-          // Clamp to [-1, 1] and convert to int16
-          const s = Math.max(-1, Math.min(1, resampledData[i]));
+          // Clamp to [-1, 1] and convert to int16 for CarPlay
+          const s = Math.max(-1, Math.min(1, sample));
           int16Data[i] = s < 0 ? s * 0x8000 : s * 0x7FFF;
         }
 
         // Log every 50 packets to verify microphone is working
-        if (packetCount % 50 === 0) {
+        if (this.debug && packetCount % 50 === 0) {
           console.log(`Mic packet ${packetCount}: ${int16Data.length} samples, max: ${Math.max(...int16Data)}`);
         }
         packetCount++;
@@ -470,10 +625,29 @@ class CarPlayManager extends EventEmitter {
     if (!this.driver) return;
 
     try {
-      const { SendAudio } = await import('../carplay/index.js');
       await this.driver.send(new SendAudio(audioData));
     } catch (error) {
-      console.error('Failed to send microphone audio:', error);
+      this.logStreamError('Failed to send microphone audio:', error);
+    }
+  }
+
+  // Errors on the per-packet paths tend to repeat for every packet once they
+  // start, so log each one at most once per interval with a skipped count
+  logStreamError(message, error) {
+    const now = performance.now();
+    const entry = this.errorLog.get(message);
+
+    if (entry && now - entry.loggedAt < ERROR_LOG_INTERVAL) {
+      entry.skipped++;
+      return;
+    }
+
+    const skipped = entry ? entry.skipped : 0;
+    this.errorLog.set(message, { loggedAt: now, skipped: 0 });
+    if (skipped > 0) {
+      console.error(message, error, `(${skipped} more since last report)`);
+    } else {
+      console.error(message, error);
     }
   }
 
@@ -485,20 +659,36 @@ class CarPlayManager extends EventEmitter {
 
   setVideoCanvas(canvas) {
     this.videoCanvas = canvas;
+    // Create the context once and reuse it for every frame and placeholder.
+    // desynchronized lets Chromium present frames without waiting on the
+    // page's compositor frame where the platform supports it
+    this.videoContext = canvas
+      ? canvas.getContext('2d', { alpha: false, desynchronized: true })
+      : null;
   }
 
   async sendTouch(x, y, action) {
     if (!this.driver) return;
 
-    const { SendTouch, TouchAction } = await import('../carplay/index.js');
+    // Drags fire a move per pointer event; drop moves that repeat the last
+    // position or arrive faster than the dongle needs. Down/Up always go out
+    const now = performance.now();
+    if (action === TouchAction.Move &&
+        ((x === this.lastTouchX && y === this.lastTouchY) ||
+         now - this.lastTouchTime < TOUCH_MOVE_INTERVAL)) {
+      return;
+    }
+    this.lastTouchTime = now;
+    this.lastTouchX = x;
+    this.lastTouchY = y;
+
     await this.driver.send(new SendTouch(x, y, action));
   }
 
   async sendCommand(command) {
-    if (!this.driver) return;
+    if (!this.driver) return null;
 
-    const { SendCommand } = await import('../carplay/index.js');
-    await this.driver.send(new SendCommand(command));
+    return this.driver.send(new SendCommand(command));
   }
 
   async disconnect() {
@@ -524,6 +714,18 @@ class CarPlayManager extends EventEmitter {
       this.videoDecoder = null;
     }
 
+    // Drop any scheduled draw so nothing runs against a torn-down session
+    if (this.frameRequestId !== null) {
+      cancelAnimationFrame(this.frameRequestId);
+      this.frameRequestId = null;
+    }
+
+    if (this.pendingFrame) {
+      this.pendingFrame.close();
+      this.pendingFrame = null;
+    }
+    this.waitingForKeyFrame = false;
+
     if (this.driver) {
       await this.driver.close();
       this.driver = null;
@@ -5,17 +5,29 @@ const { ipcRenderer } = require('electron');
 const settings = ipcRenderer.sendSync('get-settings');
 
 // Clock
+const clockElement = document.getElementById('clock');
+let lastClockText = '';
+let clockTimer = null;
+
+// Clock options only change with settings, so resolve them once there
+// rather than on every tick
+let use12HourClock;
+let showSeconds;
+
+function readClockSettings() {
+    use12HourClock = (settings.display.clockFormat || '24hr') === '12hr';
+    showSeconds = settings.display.showSeconds !== false; // Default to true
+}
+
 function updateClock() {
     const now = new Date();
-    const clockFormat = settings.display.clockFormat || '24hr';
-    const showSeconds = settings.display.showSeconds !== false; // Default to true
     
     let hours = now.getHours();
     const minutes = String(now.getMinutes()).padStart(2, '0');
     const seconds = String(now.getSeconds()).padStart(2, '0');
     
     let timeString;
-    if (clockFormat === '12hr') {
+    if (use12HourClock) {
         const ampm = hours >= 12 ? 'PM' : 'AM';
         hours = hours % 12;
         hours = hours ? hours : 12; // 0 should be 12
@@ -33,10 +45,54 @@ function updateClock() {
         }
     }
     
-    document.getElementById('clock').textContent = timeString;
+    // Only touch the DOM when the visible text actually changes
+    if (timeString !== lastClockText) {
+        lastClockText = timeString;
+        clockElement.textContent = timeString;
+    }
 }
+
+// Wake up on the next second (or minute, when seconds are hidden) boundary
+// of the wall clock rather than polling on a drifting fixed interval
+function scheduleClockTick() {
+    const period = showSeconds ? 1000 : 60000;
+    clockTimer = setTimeout(() => {
+        updateClock();
+        scheduleClockTick();
+    }, period - (Date.now() % period));
+}
+
+readClockSettings();
 updateClock();
-setInterval(updateClock, 1000);
+scheduleClockTick();
+
+// Nothing can see the clock while the window is hidden or minimized, so
+// stop ticking and catch up as soon as it becomes visible again
+document.addEventListener('visibilitychange', () => {
+    clearTimeout(clockTimer);
+    if (!document.hidden) {
+        updateClock();
+        scheduleClockTick();
+    }
+});
+
+// Each slider update spawns a pactl/brightnessctl process in the main
+// process, so while dragging only the latest value is sent per interval
+const SLIDER_SEND_INTERVAL = 50;
+
+function coalescedSender(channel) {
+    let pendingValue = null;
+    return (value) => {
+        const scheduled = pendingValue !== null;
+        pendingValue = value;
+        if (!scheduled) {
+            setTimeout(() => {
+                ipcRenderer.send(channel, pendingValue);
+                pendingValue = null;
+            }, SLIDER_SEND_INTERVAL);
+        }
+    };
+}
 
 // Apply default volume from config
 const outputVolume = settings.audio.outputVolume || 50;
@@ -44,8 +100,9 @@ document.getElementById('output').value = outputVolume;
 ipcRenderer.send('set-output-volume', outputVolume);
 
 // Volume control
+const sendOutputVolume = coalescedSender('set-output-volume');
 document.getElementById('output').addEventListener('input', (e) => {
-    ipcRenderer.send('set-output-volume', parseInt(e.target.value));
+    sendOutputVolume(parseInt(e.target.value));
 });
 
 // Apply default brightness from config
@@ -54,8 +111,9 @@ document.getElementById('brightnessSlider').value = brightness;
 ipcRenderer.send('set-brightness', brightness);
 
 // Brightness control
+const sendBrightness = coalescedSender('set-brightness');
 document.getElementById('brightnessSlider').addEventListener('input', (e) => {
-    ipcRenderer.send('set-brightness', parseInt(e.target.value));
+    sendBrightness(parseInt(e.target.value));
 });
 
 // Mute button
@@ -74,36 +132,54 @@ document.getElementById('exitBtn').addEventListener('click', () => {
 
 // Temperature display
 const tempElement = document.querySelector('.status-icons .temp');
+let lastTempText = '';
+let lastTempLevel = '';
 
 // Listen for temperature updates from backend
 ipcRenderer.on('temperature-update', (event, tempData) => {
     if (tempData && tempElement) {
         const temperatureUnit = settings.display.temperatureUnit || 'fahrenheit';
+        let tempText;
+        let tempLevel;
         
         // Display temperature based on user preference
         if (temperatureUnit === 'celsius') {
-            tempElement.textContent = `${tempData.celsius}°C`;
+            tempText = `${tempData.celsius}°C`;
             
             // Color coding for Celsius
             if (tempData.celsius < 15) {
-                tempElement.style.color = '#4da6ff'; // Blue for cold
+                tempLevel = 'cold';
             } else if (tempData.celsius > 29) {
-                tempElement.style.color = '#ff6b6b'; // Red for hot
+                tempLevel = 'hot';
             } else {
-                tempElement.style.color = '#00ff88'; // Green for normal
+                tempLevel = 'normal';
             }
         } else {
-            tempElement.textContent = `${tempData.fahrenheit}°F`;
+            tempText = `${tempData.fahrenheit}°F`;
             
             // Color coding for Fahrenheit
             if (tempData.fahrenheit < 60) {
-                tempElement.style.color = '#4da6ff'; // Blue for cold
+                tempLevel = 'cold';
             } else if (tempData.fahrenheit > 85) {
-                tempElement.style.color = '#ff6b6b'; // Red for hot
+                tempLevel = 'hot';
             } else {
-                tempElement.style.color = '#00ff88'; // Green for normal
+                tempLevel = 'normal';
             }
         }
+
+        // Readings rarely change between polls, so skip no-op DOM writes
+        if (tempText !== lastTempText) {
+            lastTempText = tempText;
+            tempElement.textContent = tempText;
+        }
+        if (tempLevel !== lastTempLevel) {
+            // Colors live in the stylesheet; only the level class is swapped
+            if (lastTempLevel) {
+                tempElement.classList.remove(lastTempLevel);
+            }
+            tempElement.classList.add(tempLevel);
+            lastTempLevel = tempLevel;
+        }
     }
 });
 
@@ -112,8 +188,13 @@ ipcRenderer.on('settings-updated', (event, newSettings) => {
     // Update local settings reference
     Object.assign(settings, newSettings);
     
-    // Refresh clock immediately
+    // Refresh clock immediately; the tick period depends on showSeconds
+    readClockSettings();
     updateClock();
+    clearTimeout(clockTimer);
+    if (!document.hidden) {
+        scheduleClockTick();
+    }
     
     // Request temperature update to refresh display
     ipcRenderer.send('get-temperature');
@@ -732,30 +732,36 @@ class MusicPlayer {
       return;
     }
 
+    // Build the list off-document and insert it in one go, so the
+    // container is laid out once instead of once per appended item
+    const fragment = document.createDocumentFragment();
+
     // Render based on view mode
     if (this.viewMode === 'artist') {
-      this.renderArtistView();
+      this.renderArtistView(fragment);
     } else if (this.viewMode === 'album') {
-      this.renderAlbumView();
+      this.renderAlbumView(fragment);
     } else {
-      this.renderFlatView();
+      this.renderFlatView(fragment);
     }
+
+    this.playlistContainer.appendChild(fragment);
   }
 
-  renderFlatView() {
+  renderFlatView(target) {
     // Show all tracks in a flat list (filtered by search query)
     this.playlist.forEach((track, index) => {
       if (this.filterTrack(track)) {
         const item = this.createTrackElement(track, index);
-        this.playlistContainer.appendChild(item);
+        target.appendChild(item);
       }
     });
   }
 
-  renderArtistView() {
+  renderArtistView(target) {
     if (this.currentArtist && this.currentAlbum) {
       // Show tracks for this album (filtered by search)
-      this.renderBreadcrumb();
+      this.renderBreadcrumb(target);
       const tracks = this.playlist.filter(t =>
         (t.metadata?.artist || 'Unknown Artist') === this.currentArtist &&
         (t.metadata?.album || 'Unknown Album') === this.currentAlbum &&
@@ -764,17 +770,17 @@ class MusicPlayer {
       tracks.forEach((track, idx) => {
         const actualIndex = this.playlist.indexOf(track);
         const item = this.createTrackElement(track, actualIndex);
-        this.playlistContainer.appendChild(item);
+        target.appendChild(item);
       });
     } else if (this.currentArtist) {
       // Show albums for this artist (filtered by search)
-      this.renderBreadcrumb();
+      this.renderBreadcrumb(target);
       const albums = this.getAlbumsForArtist(this.currentArtist);
       albums.forEach(album => {
         // Only show album if it has matching tracks
         if (this.hasMatchingTracksInAlbum(this.currentArtist, album.name)) {
           const item = this.createAlbumElement(album, this.currentArtist);
-          this.playlistContainer.appendChild(item);
+          target.appendChild(item);
         }
       });
     } else {
@@ -784,16 +790,16 @@ class MusicPlayer {
         // Only show artist if they have matching tracks
         if (this.hasMatchingTracksForArtist(artist.name)) {
           const item = this.createArtistElement(artist);
-          this.playlistContainer.appendChild(item);
+          target.appendChild(item);
         }
       });
     }
   }
 
-  renderAlbumView() {
+  renderAlbumView(target) {
     if (this.currentAlbum) {
       // Show tracks for this album (filtered by search)
-      this.renderBreadcrumb();
+      this.renderBreadcrumb(target);
       const tracks = this.playlist.filter(t =>
         (t.metadata?.album || 'Unknown Album') === this.currentAlbum &&
         this.filterTrack(t)
@@ -801,7 +807,7 @@ class MusicPlayer {
       tracks.forEach((track, idx) => {
         const actualIndex = this.playlist.indexOf(track);
         const item = this.createTrackElement(track, actualIndex);
-        this.playlistContainer.appendChild(item);
+        target.appendChild(item);
       });
     } else {
       // Show all albums grouped by artist (filtered by search)
@@ -810,13 +816,13 @@ class MusicPlayer {
         // Only show album if it has matching tracks
         if (this.hasMatchingTracksInAlbumAny(albumInfo.album)) {
           const item = this.createAlbumGroupElement(albumInfo);
-          this.playlistContainer.appendChild(item);
+          target.appendChild(item);
         }
       });
     }
   }
 
-  renderBreadcrumb() {
+  renderBreadcrumb(target) {
     const breadcrumb = document.createElement('div');
     breadcrumb.className = 'playlist-breadcrumb';
     
@@ -841,7 +847,7 @@ class MusicPlayer {
     
     breadcrumb.appendChild(backBtn);
     breadcrumb.appendChild(pathText);
-    this.playlistContainer.appendChild(breadcrumb);
+    target.appendChild(breadcrumb);
   }
 
   navigateBack() {
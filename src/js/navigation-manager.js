@@ -36,7 +36,6 @@ class NavigationManager {
      */
     async init() {
         if (this.isInitialized) {
-            console.log('Navigation already initialized');
             return;
         }
 
@@ -123,10 +123,6 @@ class SettingsManager {
       
       if (result) {
         console.log('Config saved successfully');
-        
-        // Verify the save
-        const readBack = yaml.load(fs.readFileSync(CONFIG_PATH, 'utf8'));
-        console.log('Verified saved config');
       }
       
       return result;